@@ -13,6 +13,7 @@ import spacy
 import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from reminders import REMINDER_KINDS, deadline_status, deadline_summary, new_reminder_queue, pop_due_reminders, reminder_digest, reschedule_task
 
 # === Voice Engine Setup ===
 engine = pyttsx3.init()
@@ -83,7 +84,7 @@ def save_timetable(tasks, timetable):
 # === Process User Input ===
 nlp = spacy.load('en_core_web_sm')
 
-def process_input(text, tasks):
+def process_input(text, tasks, reminders=None):
     text = text.lower()
     doc = nlp(text)
     # Conversational 'add task' intent
@@ -136,6 +137,7 @@ def process_input(text, tasks):
             if task_name in tasks:
                 return f"'{task_name}' is already in your to-do list."
             tasks[task_name] = {"done": False, "deadline": deadline, "priority": priority, "category": category, "recurring": recurring}
+            reschedule_task(reminders, tasks, task_name)
             msg = f"Added '{task_name}' to your to-do list."
             if deadline:
                 msg += f" Deadline: {deadline}."
@@ -162,18 +164,8 @@ def process_input(text, tasks):
             category = f", category: {info.get('category')}" if info.get("category") else ""
             recurring = f", recurring: {info.get('recurring')}" if info.get("recurring") else ""
             # Highlight overdue and due-soon tasks
-            highlight = ""
-            if info.get('deadline'):
-                try:
-                    due_date = datetime.datetime.strptime(info['deadline'], '%Y-%m-%d').date()
-                    today = datetime.datetime.now().date()
-                    soon = today + datetime.timedelta(days=1)
-                    if not info["done"] and due_date < today:
-                        highlight = " [OVERDUE]"
-                    elif not info["done"] and today <= due_date <= soon:
-                        highlight = " [DUE SOON]"
-                except Exception:
-                    pass
+            alert = deadline_status(info, datetime.datetime.now().date())
+            highlight = f" [{alert.upper()}]" if alert else ""
             response += f"- {task} [{status}{deadline}{priority}{category}{recurring}]{highlight}\n"
         return response.strip()
     # Filter tasks by deadline, priority, or category
@@ -204,6 +196,7 @@ def process_input(text, tasks):
         if task_name in tasks:
             return f"'{task_name}' is already in your to-do list."
         tasks[task_name] = {"done": False, "deadline": deadline, "priority": priority, "category": category, "recurring": recurring}
+        reschedule_task(reminders, tasks, task_name)
         msg = f"Added '{task_name}' to your to-do list."
         if deadline:
             msg += f" Deadline: {deadline}."
@@ -226,6 +219,7 @@ def process_input(text, tasks):
             return f"Task '{task_name}' not found in your to-do list."
         if deadline:
             tasks[task_name]["deadline"] = deadline
+            reschedule_task(reminders, tasks, task_name)
         if priority:
             tasks[task_name]["priority"] = priority
         if category:
@@ -257,6 +251,7 @@ def process_input(text, tasks):
         confirmation = listen()
         if confirmation and "yes" in confirmation.lower():
             del tasks[task_name]
+            reschedule_task(reminders, tasks, task_name)
             return f"Removed '{task_name}' from your to-do list."
         else:
             return f"Cancelled removing '{task_name}'."
@@ -271,18 +266,8 @@ def process_input(text, tasks):
             category = f", category: {info.get('category')}" if info.get("category") else ""
             recurring = f", recurring: {info.get('recurring')}" if info.get("recurring") else ""
             # Highlight overdue and due-soon tasks
-            highlight = ""
-            if info.get('deadline'):
-                try:
-                    due_date = datetime.datetime.strptime(info['deadline'], '%Y-%m-%d').date()
-                    today = datetime.datetime.now().date()
-                    soon = today + datetime.timedelta(days=1)
-                    if not info["done"] and due_date < today:
-                        highlight = " [OVERDUE]"
-                    elif not info["done"] and today <= due_date <= soon:
-                        highlight = " [DUE SOON]"
-                except Exception:
-                    pass
+            alert = deadline_status(info, datetime.datetime.now().date())
+            highlight = f" [{alert.upper()}]" if alert else ""
             response += f"- {task} [{status}{deadline}{priority}{category}{recurring}]{highlight}\n"
         return response.strip()
     if "edit task" in text or "rename task" in text:
@@ -305,6 +290,8 @@ def process_input(text, tasks):
         confirmation = listen()
         if confirmation and "yes" in confirmation.lower():
             tasks[new_name] = tasks.pop(old_name)
+            reschedule_task(reminders, tasks, old_name)
+            reschedule_task(reminders, tasks, new_name)
             return f"Renamed '{old_name}' to '{new_name}'."
         else:
             return f"Cancelled renaming '{old_name}'."
@@ -360,18 +347,22 @@ def process_input(text, tasks):
         if task in text:
             if "completed" in text or "finished" in text or "done" in text:
                 info["done"] = True
+                reschedule_task(reminders, tasks, task)
                 speak(f"Marked '{task}' as done.", voice_gender="female")
                 return None  # Already spoken
             elif "not completed" in text or "didn't" in text or "not done" in text:
                 info["done"] = False
+                reschedule_task(reminders, tasks, task)
                 speak(f"You didn’t complete '{task}' today.", voice_gender="female")
                 return None  # Already spoken
     return "Sorry, I didn't find that task in your list. You can say 'add task' to add a new one."
 
-def monitor_timetable(tasks):
+def monitor_timetable(tasks, reminders=None):
     speak("Timetable monitoring started. Say 'stop' or 'exit' to end.")
     notified = set()
     while True:
+        if reminders is not None:
+            announce_reminders(reminders, tasks)
         now = datetime.datetime.now()
         day = now.strftime('%A').lower()
         hour = now.strftime('%I').lstrip('0')
@@ -394,7 +385,7 @@ def monitor_timetable(tasks):
                     return
             time.sleep(5)
 
-def reset_recurring_tasks(tasks):
+def reset_recurring_tasks(tasks, reminders=None):
     now = datetime.datetime.now()
     today = now.strftime('%A').lower()
     week = now.isocalendar()[1]
@@ -406,35 +397,27 @@ def reset_recurring_tasks(tasks):
             last_reset = info.get('last_reset')
             current_date = now.strftime('%Y-%m-%d')
             if last_reset != current_date:
+                was_done = info.get('done')
                 info['done'] = False
                 info['last_reset'] = current_date
+                if was_done:
+                    reschedule_task(reminders, tasks, task)
         elif recurring == 'weekly':
             last_reset = info.get('last_reset_week')
             if last_reset != week:
+                was_done = info.get('done')
                 info['done'] = False
                 info['last_reset_week'] = week
+                if was_done:
+                    reschedule_task(reminders, tasks, task)
 
-def check_deadlines(tasks):
-    now = datetime.datetime.now()
-    today = now.date()
-    soon = today + datetime.timedelta(days=1)
-    reminders = []
-    overdue = []
-    for task, info in tasks.items():
-        if not isinstance(info, dict):
-            continue
-        deadline = info.get('deadline')
-        done = info.get('done')
-        if deadline:
-            try:
-                due_date = datetime.datetime.strptime(deadline, '%Y-%m-%d').date()
-                if not done and due_date < today:
-                    overdue.append(task)
-                elif not done and today <= due_date <= soon:
-                    reminders.append((task, due_date))
-            except Exception:
-                continue
-    return reminders, overdue
+def announce_reminders(reminders, tasks, due=None):
+    if due is None:
+        due = pop_due_reminders(reminders, tasks)
+    for kind in REMINDER_KINDS:
+        digest = reminder_digest(due[kind], tasks, kind)
+        if digest:
+            speak(digest)
 
 # === Listen to Microphone ===
 def listen():
@@ -608,15 +591,11 @@ def main():
         speak(f"Error loading tasks: {e}")
         tasks = {}
     reset_recurring_tasks(tasks)
-    reminders, overdue = check_deadlines(tasks)
-    if overdue:
-        speak(f"You have overdue tasks: {', '.join(overdue)}.")
-    if reminders:
-        soon_tasks = ', '.join([f"{t} (due {d})" for t, d in reminders])
-        speak(f"Upcoming deadlines: {soon_tasks}.")
+    reminders = new_reminder_queue(tasks)
     speak("Welcome to your voice to-do assistant.")
 
     while True:
+        announce_reminders(reminders, tasks)
         speak("Say 'add task buy groceries', 'list tasks', 'add timetable monday 7pm aptitude practice', 'run' to start monitoring, or 'exit' to quit.")
         user_input = listen()
 
@@ -630,17 +609,14 @@ def main():
             speak("Goodbye!")
             break
         if "run" == user_input.strip().lower():
-            reset_recurring_tasks(tasks)
-            reminders, overdue = check_deadlines(tasks)
-            if overdue:
-                speak(f"You have overdue tasks: {', '.join(overdue)}.")
-            if reminders:
-                soon_tasks = ', '.join([f"{t} (due {d})" for t, d in reminders])
-                speak(f"Upcoming deadlines: {soon_tasks}.")
-            monitor_timetable(tasks)
+            reset_recurring_tasks(tasks, reminders)
+            # Read out every current deadline, and drop queued alerts it covers
+            pop_due_reminders(reminders, tasks)
+            announce_reminders(reminders, tasks, deadline_summary(tasks, datetime.datetime.now().date()))
+            monitor_timetable(tasks, reminders)
             continue
 
-        response = process_input(user_input, tasks)
+        response = process_input(user_input, tasks, reminders)
         if response is not None:
             speak(response)
         try:
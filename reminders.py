@@ -0,0 +1,127 @@
+import datetime
+import heapq
+from collections import Counter
+
+# === Deadline Reminders ===
+REMINDER_DIGEST_SIZE = 3
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
+REMINDER_KINDS = ('overdue', 'due soon')
+
+def parse_deadline(deadline):
+    try:
+        return datetime.datetime.strptime(deadline, '%Y-%m-%d').date()
+    except Exception:
+        return None
+
+def deadline_status(info, today):
+    if not isinstance(info, dict) or info.get('done') or not info.get('deadline'):
+        return None
+    due_date = parse_deadline(info['deadline'])
+    if due_date is None:
+        return None
+    if due_date < today:
+        return 'overdue'
+    if due_date <= today + datetime.timedelta(days=1):
+        return 'due soon'
+    return None
+
+def deadline_summary(tasks, today):
+    due = {kind: [] for kind in REMINDER_KINDS}
+    for task, info in tasks.items():
+        status = deadline_status(info, today)
+        if status:
+            due[status].append(task)
+    return due
+
+def new_reminder_queue(tasks=None):
+    # queue: heap of (when, task, generation, kind) transitions
+    # generation: current generation per scheduled task; queue entries
+    # carrying any other generation are stale
+    reminders = {"queue": [], "generation": {}, "counter": 0}
+    for task in (tasks or {}):
+        reschedule_task(reminders, tasks, task)
+    return reminders
+
+def reschedule_task(reminders, tasks, task):
+    # Call whenever a task is added, removed, renamed, marked done/undone
+    # or has its deadline changed
+    if reminders is None:
+        return
+    reminders["generation"].pop(task, None)
+    _schedule_task(reminders, task, tasks.get(task))
+    if len(reminders["queue"]) > 4 * len(reminders["generation"]):
+        compact_reminders(reminders)
+
+def _schedule_task(reminders, task, info):
+    if not isinstance(info, dict) or info.get('done'):
+        return
+    due_date = parse_deadline(info.get('deadline')) if info.get('deadline') else None
+    if due_date is None:
+        return
+    reminders["counter"] += 1
+    generation = reminders["counter"]
+    reminders["generation"][task] = generation
+    # A task is due soon from midnight the day before its deadline
+    # and overdue from midnight the day after
+    midnight = datetime.datetime.combine(due_date, datetime.time.min)
+    heapq.heappush(reminders["queue"], (midnight - datetime.timedelta(days=1), task, generation, 'due soon'))
+    heapq.heappush(reminders["queue"], (midnight + datetime.timedelta(days=1), task, generation, 'overdue'))
+
+def compact_reminders(reminders):
+    generation = reminders["generation"]
+    reminders["queue"] = [entry for entry in reminders["queue"] if generation.get(entry[1]) == entry[2]]
+    heapq.heapify(reminders["queue"])
+
+def pop_due_reminders(reminders, tasks, now=None):
+    now = now or datetime.datetime.now()
+    today = now.date()
+    queue = reminders["queue"]
+    due = {kind: [] for kind in REMINDER_KINDS}
+    while queue and queue[0][0] <= now:
+        _, task, generation, kind = heapq.heappop(queue)
+        if reminders["generation"].get(task) != generation:
+            continue
+        # Both transitions may already be past (e.g. at startup); only
+        # announce the one that matches the task's current state
+        if deadline_status(tasks.get(task), today) != kind:
+            continue
+        due[kind].append(task)
+    return due
+
+def _count_phrases(counter, label, other):
+    phrases = [label(value, n) for value, n in counter.most_common(REMINDER_DIGEST_SIZE)]
+    rest = len(counter) - REMINDER_DIGEST_SIZE
+    if rest > 0:
+        phrases.append(f"{rest} other {other}")
+    return phrases
+
+def reminder_digest(task_names, tasks, kind, top_n=REMINDER_DIGEST_SIZE):
+    if not task_names:
+        return None
+
+    def urgency(task):
+        info = tasks[task]
+        return (PRIORITY_RANK.get(info.get('priority'), len(PRIORITY_RANK)), info.get('deadline') or '', task)
+
+    def describe(task):
+        if kind == 'due soon':
+            return f"{task} (due {tasks[task]['deadline']})"
+        return task
+
+    top = heapq.nsmallest(top_n, task_names, key=urgency)
+    if len(task_names) <= top_n:
+        label = "You have overdue tasks" if kind == 'overdue' else "Upcoming deadlines"
+        return f"{label}: {', '.join(describe(t) for t in top)}."
+    # Too many to read out: summarize counts and name only the most urgent
+    priorities = Counter(tasks[t].get('priority') for t in task_names if tasks[t].get('priority'))
+    categories = Counter(tasks[t].get('category') for t in task_names if tasks[t].get('category'))
+    breakdown = _count_phrases(priorities, lambda p, n: f"{n} {p} priority", "priorities")
+    breakdown += _count_phrases(categories, lambda c, n: f"{n} in {c}", "categories")
+    if kind == 'overdue':
+        msg = f"You have {len(task_names)} overdue tasks"
+    else:
+        msg = f"You have {len(task_names)} tasks due soon"
+    if breakdown:
+        msg += f" ({', '.join(breakdown)})"
+    msg += f". Most urgent: {', '.join(describe(t) for t in top)}, and {len(task_names) - len(top)} more."
+    return msg
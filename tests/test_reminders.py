@@ -0,0 +1,82 @@
+import datetime
+import unittest
+
+from reminders import (
+    REMINDER_DIGEST_SIZE,
+    new_reminder_queue,
+    pop_due_reminders,
+    reminder_digest,
+    reschedule_task,
+)
+
+NOW = datetime.datetime(2026, 10, 19, 12, 0)
+
+
+def day(offset):
+    return (NOW.date() + datetime.timedelta(days=offset)).strftime('%Y-%m-%d')
+
+
+class ReminderQueueTests(unittest.TestCase):
+    def test_overdue_task_at_startup_only_alerts_overdue(self):
+        tasks = {"essay": {"done": False, "deadline": day(-3)}}
+        reminders = new_reminder_queue(tasks)
+        due = pop_due_reminders(reminders, tasks, NOW)
+        self.assertEqual(due, {'overdue': ["essay"], 'due soon': []})
+        self.assertEqual(pop_due_reminders(reminders, tasks, NOW), {'overdue': [], 'due soon': []})
+
+    def test_due_soon_fires_when_now_crosses_midnight(self):
+        tasks = {"mock test": {"done": False, "deadline": day(2)}}
+        reminders = new_reminder_queue(tasks)
+        self.assertEqual(pop_due_reminders(reminders, tasks, NOW)['due soon'], [])
+        midnight = datetime.datetime.combine(NOW.date() + datetime.timedelta(days=1), datetime.time.min)
+        self.assertEqual(pop_due_reminders(reminders, tasks, midnight - datetime.timedelta(seconds=1))['due soon'], [])
+        self.assertEqual(pop_due_reminders(reminders, tasks, midnight)['due soon'], ["mock test"])
+
+    def test_done_and_deadline_edits_invalidate_queued_entries(self):
+        tasks = {"resume": {"done": False, "deadline": day(-1)}, "dsa": {"done": False, "deadline": day(-1)}}
+        reminders = new_reminder_queue(tasks)
+        tasks["resume"]["done"] = True
+        reschedule_task(reminders, tasks, "resume")
+        tasks["dsa"]["deadline"] = day(10)
+        reschedule_task(reminders, tasks, "dsa")
+        self.assertEqual(pop_due_reminders(reminders, tasks, NOW), {'overdue': [], 'due soon': []})
+        later = NOW + datetime.timedelta(days=9)
+        self.assertEqual(pop_due_reminders(reminders, tasks, later)['due soon'], ["dsa"])
+
+    def test_repeated_edits_do_not_grow_queue(self):
+        tasks = {"project": {"done": False, "deadline": day(30)}}
+        reminders = new_reminder_queue(tasks)
+        for _ in range(100):
+            tasks["project"]["done"] = not tasks["project"]["done"]
+            reschedule_task(reminders, tasks, "project")
+        self.assertLessEqual(len(reminders["queue"]), 4)
+
+    def test_removed_task_is_not_announced(self):
+        tasks = {"old": {"done": False, "deadline": day(-1)}}
+        reminders = new_reminder_queue(tasks)
+        del tasks["old"]
+        reschedule_task(reminders, tasks, "old")
+        self.assertEqual(pop_due_reminders(reminders, tasks, NOW)['overdue'], [])
+
+
+class ReminderDigestTests(unittest.TestCase):
+    def test_small_set_lists_every_task(self):
+        tasks = {f"t{i}": {"done": False, "deadline": day(-1)} for i in range(REMINDER_DIGEST_SIZE)}
+        digest = reminder_digest(list(tasks), tasks, 'overdue')
+        self.assertEqual(digest, "You have overdue tasks: t0, t1, t2.")
+
+    def test_large_set_is_summarized(self):
+        tasks = {
+            f"t{i}": {"done": False, "deadline": day(-1), "priority": "high" if i < 2 else "low", "category": f"cat{i}"}
+            for i in range(20)
+        }
+        digest = reminder_digest(list(tasks), tasks, 'overdue')
+        self.assertTrue(digest.startswith("You have 20 overdue tasks (18 low priority, 2 high priority, "))
+        self.assertIn("1 in cat0", digest)
+        self.assertIn("17 other categories", digest)
+        self.assertNotIn("cat19", digest)
+        self.assertTrue(digest.endswith("Most urgent: t0, t1, t10, and 17 more."))
+
+
+if __name__ == "__main__":
+    unittest.main()